@@ -1,7 +1,8 @@
-from .core import QsqlFile, QsqlManager
+from .core import Cell, QsqlFile, QsqlManager
 from .parsers import Parser, ParserRegistry, KeyValueParser, DictLikeParser
 
 __all__ = [
+    "Cell",
     "QsqlFile",
     "QsqlManager",
     "Parser",
@@ -1,4 +1,5 @@
+from .cell import Cell
 from .file import QsqlFile
 from .manager import QsqlManager
 
-__all__ = ["QsqlFile", "QsqlManager"]
+__all__ = ["Cell", "QsqlFile", "QsqlManager"]
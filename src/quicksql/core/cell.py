@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Cell:
+    """A named block of SQL within a QSQL file."""
+
+    name: str
+    start: int
+    end: int
+    text: str
@@ -1,54 +1,287 @@
+import os
 import re
+import sys
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import NamedTuple, overload
+
+from .cell import Cell
+
+
+# Number of distinct file revisions whose parse results are kept
+_PARSE_CACHE_SIZE = 256
+
+# Smallest read request; later requests grow with the amount read so far
+_MIN_READ_SIZE = 128 * 1024
+
+# Characters str.splitlines() treats as line boundaries
+_LINE_BREAK_CHARS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_LINE_BREAKS = frozenset(_LINE_BREAK_CHARS)
+
+# Matches "-- name: <cell>" anywhere in the content. Left unanchored so the
+# engine can search for the literal "--"; the gaps exclude every splitlines()
+# boundary and those all count as whitespace, so no match crosses a line.
+_CELL_NAME_RE = re.compile(
+    r"--[^\S{br}]*name:[^\S{br}]*(\S+)".format(br=re.escape(_LINE_BREAK_CHARS))
+)
+
+
+def _line_end(content: str, line_offsets: Sequence[int], line_number: int) -> int:
+    """Return the offset just past the text of a line, before its line break."""
+    end_offset = line_offsets[line_number + 1]
+    if end_offset and content[end_offset - 1] in _LINE_BREAKS:
+        end_offset -= 1
+    return end_offset
+
+
+class _LineView(Sequence[tuple[int, str]]):
+    """Read-only (line number, line content) pairs sliced from content on demand."""
+
+    __slots__ = ("_content", "_line_offsets")
+
+    def __init__(self, content: str, line_offsets: Sequence[int]) -> None:
+        self._content = content
+        self._line_offsets = line_offsets
+
+    def __len__(self) -> int:
+        return len(self._line_offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[int, str]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[tuple[int, str], ...]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        start = self._line_offsets[index]
+        end = _line_end(self._content, self._line_offsets, index)
+        return (index, self._content[start:end])
+
+    def __eq__(self, other: object) -> bool:
+        # Compare like the tuple of pairs this view replaced
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            line == other_line for line, other_line in zip(self, other)
+        )
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+
+def _read_text(fd: int, file_stat: os.stat_result) -> str:
+    """Read and decode everything left in an open file using sized reads."""
+    # A short read does not mean EOF (reads are capped per call and can be cut
+    # short by signals or network filesystems), so read until os.read is empty
+    size = max(file_stat.st_size, _MIN_READ_SIZE)
+    chunks = []
+    total = 0
+    while chunk := os.read(fd, size):
+        chunks.append(chunk)
+        total += len(chunk)
+        size = max(total, _MIN_READ_SIZE)
+
+    # Decode the raw bytes directly rather than going through the text IO stack
+    return _normalize_newlines(b"".join(chunks).decode("utf-8"))
+
+
+def _normalize_newlines(text: str) -> str:
+    """Convert \r\n and \r to \n, skipping the work when there is no \r."""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _line_start_offsets(content: str) -> array:
+    """Return the offset in content at which each line starts, plus the end."""
+    offsets = array("q", [0])
+    end_offset = 0
+    for line_text in content.splitlines(keepends=True):
+        end_offset += len(line_text)
+        offsets.append(end_offset)
+    return offsets
+
+
+def _slice_lines(
+    content: str, line_offsets: Sequence[int], start: int, stop: int
+) -> str:
+    """Return lines[start:stop] as text without the final line terminator."""
+    if start >= stop:
+        return ""
+    end_offset = _line_end(content, line_offsets, stop - 1)
+    return content[line_offsets[start] : end_offset]
+
+
+def _scan_cells(content: str, line_offsets: Sequence[int]) -> tuple[Cell, ...]:
+    """Split content into cells at each "-- name:" header line."""
+    starts = []
+    line_number = -1
+    for match in _CELL_NAME_RE.finditer(content):
+        # Matches come in order, so only search lines after the previous one
+        match_line = bisect_right(line_offsets, match.start(), line_number + 1) - 1
+        # Only the first "-- name:" on a line starts a cell
+        if match_line != line_number:
+            line_number = match_line
+            starts.append((line_number, sys.intern(match.group(1))))
+
+    # Each cell runs up to the line before the next cell's header
+    stops = [line_number for line_number, _ in starts[1:]] + [len(line_offsets) - 1]
+
+    return tuple(
+        Cell(
+            name=cell_name,
+            start=cell_start,
+            end=cell_stop - 1,
+            text=_slice_lines(content, line_offsets, cell_start, cell_stop),
+        )
+        for (cell_start, cell_name), cell_stop in zip(starts, stops)
+    )
+
+
+class _ParsedFile(NamedTuple):
+    content: str
+    line_offsets: array
+    cells: tuple[Cell, ...]
+
+
+def _parse_content(content: str) -> _ParsedFile:
+    """Split already normalized content into lines and cells."""
+    line_offsets = _line_start_offsets(content)
+    return _ParsedFile(content, line_offsets, _scan_cells(content, line_offsets))
+
+
+# Parse results shared between QsqlFile instances, keyed by
+# (absolute path, st_mtime_ns, st_size) and evicted least recently used first
+_parse_cache: OrderedDict[tuple[str, int, int], _ParsedFile] = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _parse_file(
+    file_path: str, use_cache: bool = True
+) -> tuple[_ParsedFile, tuple[int, int]]:
+    """Read and split a file, reusing the shared result for an unchanged revision.
+
+    The (st_mtime_ns, st_size) key comes from fstat on the descriptor that is
+    read, so it always describes the content returned. With use_cache=False
+    the file is always read and the shared entry is replaced.
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        file_stat = os.fstat(fd)
+        stat_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        cache_key = (file_path, *stat_key)
+
+        if use_cache:
+            with _parse_cache_lock:
+                parsed = _parse_cache.get(cache_key)
+                if parsed is not None:
+                    _parse_cache.move_to_end(cache_key)
+                    return parsed, stat_key
+
+        parsed = _parse_content(_read_text(fd, file_stat))
+    finally:
+        os.close(fd)
+
+    with _parse_cache_lock:
+        _parse_cache[cache_key] = parsed
+        _parse_cache.move_to_end(cache_key)
+        while len(_parse_cache) > _PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+
+    return parsed, stat_key
 
 
 class QsqlFile:
-    def __init__(self, file_path: Path) -> None:
+    _cached_attrs = (
+        "_parsed",
+        "content",
+        "lines",
+        "_line_offsets",
+        "cell_blocks",
+        "cells_by_name",
+        "header",
+    )
+
+    def __init__(self, file_path: Path, text: str | None = None) -> None:
         self.file_path: Path = file_path
+        self._text: str | None = text
+        self._stat_key: tuple[int, int] | None = None
+        self._bypass_cache = False
 
-        if not self.file_path.exists():
+        if text is None and not self.file_path.exists():
             raise FileNotFoundError(f"File {self.file_path} does not exist.")
 
-    @property
-    def content(self) -> str:
-        return self.file_path.read_text()
+    @classmethod
+    def from_string(cls, text: str, file_path: Path | None = None) -> "QsqlFile":
+        """Build a QsqlFile from in-memory text; file_path is only a label."""
+        return cls(file_path if file_path is not None else Path("<string>"), text)
+
+    def invalidate(self) -> None:
+        """Drop cached file data so the next access re-reads the file."""
+        for name in self._cached_attrs:
+            self.__dict__.pop(name, None)
+        self._bypass_cache = True
 
-    @property
-    def lines(self) -> tuple[tuple[int, str], ...]:
-        """Return a tuple with line number and line content."""
-        return tuple(enumerate(self.content.splitlines()))
+    def refresh(self) -> bool:
+        """Invalidate cached data if the file changed on disk since it was read."""
+        if self._stat_key is None:
+            return False
+        file_stat = os.stat(self.file_path)
+        if (file_stat.st_mtime_ns, file_stat.st_size) == self._stat_key:
+            return False
+        self.invalidate()
+        return True
 
-    @property
-    def cell_blocks(self) -> list[dict[str, Any]]:
-        lines = self.lines
-        last_line_number = len(lines)
+    @cached_property
+    def _parsed(self) -> _ParsedFile:
+        if self._text is not None:
+            return _parse_content(_normalize_newlines(self._text))
 
-        cell_blocks = []
+        # Key on the absolute path so relative paths from different working
+        # directories never share an entry
+        parsed, self._stat_key = _parse_file(
+            os.path.abspath(self.file_path), use_cache=not self._bypass_cache
+        )
+        self._bypass_cache = False
+        return parsed
 
-        pattern = re.compile(r"--\s*?name:\s*?(\S+)\s*?")
+    @cached_property
+    def content(self) -> str:
+        return self._parsed.content
 
-        for line_number, line_text in reversed(lines):
-            match = pattern.search(line_text)
+    @cached_property
+    def lines(self) -> Sequence[tuple[int, str]]:
+        """Return a sequence of line number and line content."""
+        return _LineView(self.content, self._line_offsets)
 
-            if match:
-                cell_dict = {
-                    "cell_name": match.group(1),
-                    "cell_start": line_number,
-                    "cell_end": last_line_number - 1,
-                    "text": "\n".join(
-                        line_text[1]
-                        for line_text in lines[line_number:last_line_number]
-                    ),
-                }
-                cell_blocks.append(cell_dict)
-                last_line_number = line_number
+    @cached_property
+    def _line_offsets(self) -> array:
+        return self._parsed.line_offsets
 
-        cell_blocks.reverse()
+    @cached_property
+    def cell_blocks(self) -> list[Cell]:
+        return list(self._parsed.cells)
 
-        return cell_blocks
+    @cached_property
+    def cells_by_name(self) -> dict[str, Cell]:
+        """Map cell names to cells; the first cell wins if a name repeats."""
+        cells_by_name = {}
+        for cell in self.cell_blocks:
+            cells_by_name.setdefault(cell.name, cell)
+        return cells_by_name
 
-    @property
+    @cached_property
     def header(self) -> str:
         cell_blocks = self.cell_blocks
 
@@ -57,6 +290,4 @@ class QsqlFile:
 
         first_block = cell_blocks[0]
 
-        return "\n".join(
-            line_text[1] for line_text in self.lines[: first_block["cell_start"]]
-        )
+        return _slice_lines(self.content, self._line_offsets, 0, first_block.start)
@@ -18,11 +18,9 @@ class QsqlManager:
         else:
             self._file = qsql_file
 
-        # Use provided parsers or auto-discover from registry
+        # Use provided parsers or the registry's shared instances
         if parsers is None:
-            self.parsers = [
-                parser_class() for parser_class in ParserRegistry.get_parsers()
-            ]
+            self.parsers = list(ParserRegistry.get_instances())
         else:
             self.parsers = list(parsers)
 
@@ -30,12 +28,21 @@ class QsqlManager:
 
     def _parse_header(self) -> dict[str, Any]:
         """Parse the header using the configured parsers."""
+        header = self._file.header
         result = {}
         for parser in self.parsers:
-            parsed = parser.parse(self._file.header)
-            result.update(parsed)
+            if not parser.probe(header):
+                continue
+            result.update(parser.parse(header))
         return result
 
+    def refresh(self) -> bool:
+        """Re-parse the header in place if the file changed on disk."""
+        if not self._file.refresh():
+            return False
+        self._header = self._parse_header()
+        return True
+
     @property
     def header(self) -> dict[str, Any]:
         """Get the parsed header configuration."""
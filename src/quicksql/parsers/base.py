@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Any, Pattern
+from typing import Any, ClassVar, Pattern
 
 
 class ParserRegistry:
     """Registry for parser classes using decorator pattern."""
 
     _parsers = {}
+    _instances = None
 
     @classmethod
     def register(cls, name: str):
@@ -13,6 +14,7 @@ class ParserRegistry:
 
         def decorator(parser_class):
             cls._parsers[name] = parser_class
+            cls._instances = None
             return parser_class
 
         return decorator
@@ -22,20 +24,31 @@ class ParserRegistry:
         """Get all registered parser classes."""
         return cls._parsers.values()
 
+    @classmethod
+    def get_instances(cls):
+        """Get shared instances of all registered parser classes."""
+        if cls._instances is None:
+            cls._instances = tuple(
+                parser_class() for parser_class in cls._parsers.values()
+            )
+        return cls._instances
+
     @classmethod
     def clear(cls):
         """Clear all registered parsers (useful for testing)."""
         cls._parsers.clear()
+        cls._instances = None
 
 
 class Parser(ABC):
     """Abstract base class for parsing config out of cell blocks or the global file header."""
 
-    @property
-    @abstractmethod
-    def pattern(self) -> Pattern[str]:
-        pass
+    pattern: ClassVar[Pattern[str]]
 
     @abstractmethod
     def parse(self, data: str) -> dict[str, Any]:
         pass
+
+    def probe(self, data: str) -> bool:
+        """Cheap check for whether parse could find anything in data."""
+        return True
@@ -1,7 +1,12 @@
 import re
-from typing import Any, Pattern
+from typing import Any, ClassVar, Pattern
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from .base import Parser, ParserRegistry
 
 
@@ -9,16 +14,17 @@ from .base import Parser, ParserRegistry
 class DictLikeParser(Parser):
     """Parser for extracting YAML-like content from /* */ comment blocks."""
 
-    @property
-    def pattern(self) -> Pattern[str]:
-        return re.compile(r"/\*(.*?)\*/", re.DOTALL)
+    pattern: ClassVar[Pattern[str]] = re.compile(r"/\*(.*?)\*/", re.DOTALL)
+
+    def probe(self, data: str) -> bool:
+        return "/*" in data
 
     def parse(self, data: str) -> dict[str, Any]:
         matches = self.pattern.findall(data)
         result = {}
         for match in matches:
             try:
-                parsed = yaml.safe_load(match.strip())
+                parsed = yaml.load(match.strip(), Loader=SafeLoader)
                 if isinstance(parsed, dict):
                     result.update(parsed)
             except yaml.YAMLError:
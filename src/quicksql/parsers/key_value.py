@@ -1,5 +1,5 @@
 import re
-from typing import Any, Pattern
+from typing import Any, ClassVar, Pattern
 
 from .base import Parser, ParserRegistry
 
@@ -8,9 +8,10 @@ from .base import Parser, ParserRegistry
 class KeyValueParser(Parser):
     """Parser for extracting key-value pairs from comment lines like '-- key: value'."""
 
-    @property
-    def pattern(self) -> Pattern[str]:
-        return re.compile(r"--\s*?(\S+):\s*?(\S+)\s*?")
+    pattern: ClassVar[Pattern[str]] = re.compile(r"--\s*?(\S+):\s*?(\S+)\s*?")
+
+    def probe(self, data: str) -> bool:
+        return "--" in data
 
     def parse(self, data: str) -> dict[str, Any]:
         matches = self.pattern.findall(data)
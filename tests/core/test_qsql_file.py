@@ -1,5 +1,7 @@
 """Test Cases for Qsql File Class"""
 
+import os
+
 from quicksql import QsqlFile
 
 
@@ -21,27 +23,26 @@ def test_qsql_file_code_blocks(qsql_file_basic):
     assert len(q_file.cell_blocks) == 3
 
     # Check first cell block
-    assert q_file.cell_blocks[0]["cell_name"] == "query_1"
-    assert q_file.cell_blocks[0]["cell_start"] == 4
-    assert q_file.cell_blocks[0]["cell_end"] == 6
-    assert q_file.cell_blocks[0]["text"] == "-- name: query_1\nSELECT * FROM user;\n"
+    assert q_file.cell_blocks[0].name == "query_1"
+    assert q_file.cell_blocks[0].start == 4
+    assert q_file.cell_blocks[0].end == 6
+    assert q_file.cell_blocks[0].text == "-- name: query_1\nSELECT * FROM user;\n"
 
     # Check second cell block
-    assert q_file.cell_blocks[1]["cell_name"] == "query_2"
-    assert q_file.cell_blocks[1]["cell_start"] == 7
-    assert q_file.cell_blocks[1]["cell_end"] == 11
+    assert q_file.cell_blocks[1].name == "query_2"
+    assert q_file.cell_blocks[1].start == 7
+    assert q_file.cell_blocks[1].end == 11
     assert (
-        q_file.cell_blocks[1]["text"]
+        q_file.cell_blocks[1].text
         == "-- name: query_2\nSELECT *\nFROM user\nWHERE name = 'Alice';\n"
     )
 
     # Check third cell block
-    assert q_file.cell_blocks[2]["cell_name"] == "query_3"
-    assert q_file.cell_blocks[2]["cell_start"] == 12
-    assert q_file.cell_blocks[2]["cell_end"] == 13
+    assert q_file.cell_blocks[2].name == "query_3"
+    assert q_file.cell_blocks[2].start == 12
+    assert q_file.cell_blocks[2].end == 13
     assert (
-        q_file.cell_blocks[2]["text"]
-        == "-- name: query_3\nSELECT COUNT(*) AS user_count;"
+        q_file.cell_blocks[2].text == "-- name: query_3\nSELECT COUNT(*) AS user_count;"
     )
 
 
@@ -50,3 +51,153 @@ def test_qsql_file_header(qsql_file_basic):
 
     expected_header = "/*\ninput:\n  duckdb: /tmp/test.ddb\n*/"
     assert q_file.header == expected_header
+
+
+def test_qsql_file_invalidate(tmp_path):
+    file_path = tmp_path / "cached.sql"
+    file_path.write_text("-- name: query_1\nSELECT 1;")
+    q_file = QsqlFile(file_path)
+
+    assert [block.name for block in q_file.cell_blocks] == ["query_1"]
+
+    file_path.write_text("-- name: query_1\nSELECT 1;\n-- name: query_2\nSELECT 2;")
+    assert len(q_file.cell_blocks) == 1
+
+    q_file.invalidate()
+    assert [block.name for block in q_file.cell_blocks] == [
+        "query_1",
+        "query_2",
+    ]
+
+
+def test_qsql_file_crlf_newlines(tmp_path):
+    file_path = tmp_path / "crlf.sql"
+    file_path.write_bytes(
+        b"-- name: query_1\r\nSELECT 1;\r\n-- name: query_2\r\nSELECT 2;"
+    )
+    q_file = QsqlFile(file_path)
+
+    assert q_file.cell_blocks[0].text == "-- name: query_1\nSELECT 1;"
+    assert q_file.cell_blocks[1].text == "-- name: query_2\nSELECT 2;"
+
+
+def test_qsql_file_refresh(tmp_path):
+    file_path = tmp_path / "refresh.sql"
+    file_path.write_text("-- name: query_1\nSELECT 1;")
+    q_file = QsqlFile(file_path)
+
+    assert q_file.cell_blocks[0].text == "-- name: query_1\nSELECT 1;"
+    assert q_file.refresh() is False
+
+    # Same size, so only the mtime marks the change
+    file_path.write_text("-- name: query_1\nSELECT 2;")
+    os.utime(file_path, ns=(0, os.stat(file_path).st_mtime_ns + 1))
+    assert q_file.refresh() is True
+    assert q_file.cell_blocks[0].text == "-- name: query_1\nSELECT 2;"
+
+    # Different size is caught even if the mtime does not move
+    mtime_ns = os.stat(file_path).st_mtime_ns
+    file_path.write_text("-- name: query_1\nSELECT 1;\n-- name: query_2\nSELECT 2;")
+    os.utime(file_path, ns=(0, mtime_ns))
+    assert q_file.refresh() is True
+    assert len(q_file.cell_blocks) == 2
+
+
+def test_qsql_file_cells_by_name(qsql_file_basic):
+    q_file = QsqlFile(qsql_file_basic)
+
+    assert list(q_file.cells_by_name) == ["query_1", "query_2", "query_3"]
+    assert q_file.cells_by_name["query_2"] is q_file.cell_blocks[1]
+
+
+def test_qsql_file_shares_parse_between_instances(qsql_file_basic):
+    first = QsqlFile(qsql_file_basic)
+    second = QsqlFile(qsql_file_basic)
+
+    assert first.cell_blocks == second.cell_blocks
+    assert all(a is b for a, b in zip(first.cell_blocks, second.cell_blocks))
+
+
+def test_qsql_file_from_string():
+    q_file = QsqlFile.from_string("/*\ninput: {}\n*/\r\n-- name: query_1\nSELECT 1;")
+
+    assert q_file.header == "/*\ninput: {}\n*/"
+    assert [block.name for block in q_file.cell_blocks] == ["query_1"]
+    assert q_file.refresh() is False
+
+
+def test_qsql_file_unicode_line_breaks():
+    q_file = QsqlFile.from_string("SELECT 0;\x0c-- name: q1\nSELECT 1;")
+
+    assert q_file.header == "SELECT 0;"
+    assert q_file.cell_blocks[0].name == "q1"
+    assert q_file.cell_blocks[0].start == 1
+    assert q_file.cell_blocks[0].text == "-- name: q1\nSELECT 1;"
+
+    q_file = QsqlFile.from_string("-- name: q1\u2028SELECT 1;\n-- name: q2\nSELECT 2;")
+
+    assert [block.name for block in q_file.cell_blocks] == ["q1", "q2"]
+    assert q_file.cell_blocks[0].text == "-- name: q1\u2028SELECT 1;"
+
+
+def test_qsql_file_unicode_whitespace_in_cell_header():
+    q_file = QsqlFile.from_string(
+        "-- name:\xa0q1\nSELECT 1;\n--\u3000name: q2\nSELECT 2;"
+    )
+
+    assert [block.name for block in q_file.cell_blocks] == ["q1", "q2"]
+    assert q_file.header == ""
+
+
+def test_qsql_file_short_reads(tmp_path, monkeypatch):
+    file_path = tmp_path / "short.sql"
+    file_path.write_text("-- name: query_1\nSELECT 1;\n-- name: query_2\nSELECT 2;")
+
+    real_read = os.read
+    monkeypatch.setattr(os, "read", lambda fd, size: real_read(fd, min(size, 7)))
+
+    q_file = QsqlFile(file_path)
+    assert [block.name for block in q_file.cell_blocks] == ["query_1", "query_2"]
+    assert q_file.cell_blocks[1].text == "-- name: query_2\nSELECT 2;"
+
+
+def test_qsql_file_invalidate_rereads_same_size_rewrite(tmp_path):
+    file_path = tmp_path / "same_size.sql"
+    file_path.write_text("-- name: query_1\nSELECT 1;")
+    q_file = QsqlFile(file_path)
+    assert q_file.cell_blocks[0].text == "-- name: query_1\nSELECT 1;"
+
+    # Same size and same mtime, as with a rewrite inside the mtime resolution
+    mtime_ns = os.stat(file_path).st_mtime_ns
+    file_path.write_text("-- name: query_1\nSELECT 2;")
+    os.utime(file_path, ns=(0, mtime_ns))
+
+    q_file.invalidate()
+    assert q_file.cell_blocks[0].text == "-- name: query_1\nSELECT 2;"
+    assert QsqlFile(file_path).cell_blocks[0].text == "-- name: query_1\nSELECT 2;"
+
+
+def test_qsql_file_many_cells():
+    text = "/*\ninput: dict\n*/\n" + "".join(
+        f"-- name: query_{i} -- name: ignored\nSELECT * FROM user\nWHERE id = {i};\n"
+        for i in range(500)
+    )
+    q_file = QsqlFile.from_string(text)
+
+    assert len(q_file.cell_blocks) == 500
+    assert [cell.name for cell in q_file.cell_blocks] == [
+        f"query_{i}" for i in range(500)
+    ]
+    assert [cell.start for cell in q_file.cell_blocks] == list(range(3, 1503, 3))
+    assert q_file.cell_blocks[-1].end == 1502
+    assert q_file.header == "/*\ninput: dict\n*/"
+
+
+def test_qsql_file_lines_compare_as_tuple():
+    q_file = QsqlFile.from_string("a\nb")
+
+    assert q_file.lines == ((0, "a"), (1, "b"))
+    assert ((0, "a"), (1, "b")) == q_file.lines
+    assert q_file.lines != ((0, "a"),)
+    assert q_file.lines != "ab"
+    assert hash(q_file.lines) == hash(((0, "a"), (1, "b")))
@@ -6,3 +6,27 @@ def test_qsql_manager_header_config(qsql_file_basic):
 
     expected_header_dict = {"input": {"duckdb": "/tmp/test.ddb"}}
     assert q_manager.header == expected_header_dict
+
+
+def test_qsql_manager_shares_default_parsers(qsql_file_basic):
+    first = QsqlManager(qsql_file_basic)
+    second = QsqlManager(qsql_file_basic)
+
+    assert [type(parser) for parser in first.parsers] == [
+        type(parser) for parser in second.parsers
+    ]
+    assert all(a is b for a, b in zip(first.parsers, second.parsers))
+
+
+def test_qsql_manager_refresh(tmp_path):
+    file_path = tmp_path / "refresh.sql"
+    file_path.write_text("-- db: first\n-- name: query_1\nSELECT 1;")
+    q_manager = QsqlManager(file_path)
+
+    assert q_manager.header == {"db": "first"}
+    assert q_manager.refresh() is False
+
+    file_path.write_text("-- db: changed\n-- name: query_1\nSELECT 1;")
+
+    assert q_manager.refresh() is True
+    assert q_manager.header == {"db": "changed"}
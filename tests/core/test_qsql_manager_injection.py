@@ -1,7 +1,7 @@
 """Test QSQLManager with explicit parser injection."""
 
 from pathlib import Path
-from quicksql import QsqlManager
+from quicksql import QsqlFile, QsqlManager
 from quicksql.parsers import KeyValueParser, DictLikeParser
 
 
@@ -46,3 +46,18 @@ def test_qsql_manager_parser_order(qsql_file_basic: Path):
     # DictLikeParser result should override any key conflicts
     expected_header_dict = {"input": {"duckdb": "/tmp/test.ddb"}}
     assert q_manager.header == expected_header_dict
+
+
+def test_qsql_manager_many_parsers_keep_order():
+    """Test that later parsers win when several parsers set the same key."""
+    q_file = QsqlFile.from_string(
+        "/*\ninput: dict\n*/\n-- input: kv\n-- name: query_1\n"
+    )
+
+    parsers = [KeyValueParser(), DictLikeParser(), KeyValueParser()]
+    q_manager = QsqlManager(q_file, parsers=parsers)
+    assert q_manager.header == {"input": "kv"}
+
+    parsers = [DictLikeParser(), KeyValueParser(), DictLikeParser()]
+    q_manager = QsqlManager(q_file, parsers=parsers)
+    assert q_manager.header == {"input": "dict"}
@@ -31,3 +31,13 @@ def test_dict_like_parser():
     expected_output = {"input": {"duckdb": "/tmp/test.ddb"}}
 
     assert result == expected_output
+
+
+def test_parser_probe():
+    key_value = KeyValueParser()
+    dict_like = DictLikeParser()
+
+    assert key_value.probe("-- key1: value1")
+    assert not key_value.probe("/* input: {} */")
+    assert dict_like.probe("/* input: {} */")
+    assert not dict_like.probe("-- key1: value1")